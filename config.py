@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
 BASE_URL = "https://products.mhra.gov.uk"
 SUBSTANCE_INDEX_PATH = "/substance-index/?letter={letter}"
-LETTERS = [
+LETTERS = (
     "A",
     "B",
     "C",
@@ -42,13 +43,10 @@ LETTERS = [
     "7",
     "8",
     "9",
-]
+)
+# Index page of each letter; the path is root-relative, so joining it to the origin is plain concatenation
+LETTER_INDEX_URLS = {letter: BASE_URL + SUBSTANCE_INDEX_PATH.format(letter=letter) for letter in LETTERS}
 
-# Root = Backend folder (where main.py and this config live)
-BACKEND_PATH = Path(__file__).resolve().parent
-# Generated files go in Backend/public (latest overwritten here; versioned in public/Version N)
-PUBLIC_PATH = BACKEND_PATH / "public"
-LATEST_OUTPUT_PATH = PUBLIC_PATH
 OUTPUT_VERSION_PREFIX = "Version "
 GENERATED_FILES = {
     "mhra_ultra": "mhra_ultra_3.0.json",
@@ -61,8 +59,58 @@ DEFAULT_HEADLESS = True
 NAVIGATION_TIMEOUT_MS = 90000
 REQUEST_DELAY_SECONDS = 0.15
 MAX_RETRIES = 3
+# Sent by the HTTP listing fetcher, which is otherwise more likely than the browser to be refused
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+# Listing pages fetched over HTTP are cached on disk and reused without a request for this long
+PAGE_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Pages crawled in parallel, one browser tab each
+MAX_CONCURRENCY = 4
+BROWSER_VIEWPORT = {"width": 800, "height": 600}
+# Playwright resource types aborted before they are requested
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+# Routing turns off the browser HTTP cache, so GET bodies of these static types are kept and replayed for the run
+CACHED_RESOURCE_TYPES = frozenset({"script"})
+# Progress bar changes are batched and pushed to Rich at most this often
+PROGRESS_REFRESH_SECONDS = 0.1
 
 # Firebase Storage (used when --upload-to-firebase is set)
 FIREBASE_STORAGE_BUCKET = os.environ.get("FIREBASE_STORAGE_BUCKET", "")
 FIREBASE_STORAGE_PREFIX = os.environ.get("FIREBASE_STORAGE_PREFIX", "mhra")
+FIREBASE_UPLOAD_WORKERS = 8
 
+
+@functools.cache
+def backend_path() -> Path:
+    # Root = Backend folder (where main.py and this config live)
+    return Path(__file__).resolve().parent
+
+
+@functools.cache
+def public_path() -> Path:
+    # Generated files go in Backend/public (latest overwritten here; versioned in public/Version N).
+    # MHRA_PUBLIC_PATH points the output somewhere else, e.g. for test runs.
+    override = os.environ.get("MHRA_PUBLIC_PATH")
+    return Path(override) if override else backend_path() / "public"
+
+
+@functools.cache
+def page_cache_path() -> Path:
+    return backend_path() / ".cache" / "pages.sqlite3"
+
+
+_LAZY_PATHS = {
+    "BACKEND_PATH": backend_path,
+    "PUBLIC_PATH": public_path,
+    "LATEST_OUTPUT_PATH": public_path,
+    "PAGE_CACHE_PATH": page_cache_path,
+}
+
+
+def __getattr__(name: str) -> Path:
+    # Path constants are resolved on first access instead of at import time.
+    try:
+        return _LAZY_PATHS[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
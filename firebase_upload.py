@@ -4,15 +4,22 @@ Requires firebase-admin and a service account key (see README).
 """
 from __future__ import annotations
 
+import functools
+import gzip
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import config
 
 
+@functools.lru_cache(maxsize=1)
 def _get_bucket(bucket_name: str, credentials_path: Optional[str] = None):
     import firebase_admin
     from firebase_admin import credentials, storage
+    from requests.adapters import HTTPAdapter
 
     try:
         firebase_admin.get_app()
@@ -22,7 +29,16 @@ def _get_bucket(bucket_name: str, credentials_path: Optional[str] = None):
         else:
             cred = credentials.ApplicationDefault()
         firebase_admin.initialize_app(cred, {"storageBucket": bucket_name})
-    return storage.bucket(bucket_name)
+    bucket = storage.bucket(bucket_name)
+    # Keep one pooled connection per upload worker, also when FIREBASE_UPLOAD_WORKERS exceeds requests' default of 10.
+    adapter = HTTPAdapter(pool_connections=config.FIREBASE_UPLOAD_WORKERS, pool_maxsize=config.FIREBASE_UPLOAD_WORKERS)
+    bucket.client._http.mount("https://", adapter)
+    return bucket
+
+
+def _gzip_file(source: Path, destination: Path) -> None:
+    with source.open("rb") as raw, gzip.open(destination, "wb", compresslevel=6) as compressed:
+        shutil.copyfileobj(raw, compressed, length=1024 * 1024)
 
 
 def upload_generated_files(
@@ -37,21 +53,35 @@ def upload_generated_files(
     Upload all generated JSON files to Firebase Storage.
     - Latest copies under `{storage_prefix}/latest/`
     - Versioned copies under `{storage_prefix}/{version_label}/`
+    Files are stored gzip-compressed with `Content-Encoding: gzip`; HTTP clients decompress them transparently.
     """
     bucket = _get_bucket(bucket_name, credentials_path)
     filenames = list(config.GENERATED_FILES.values())
     version_folder = version_label.replace("/", "_")
 
-    for filename in filenames:
-        local_file = latest_path / filename
-        if not local_file.exists():
-            continue
-        content_type = "application/json"
-        # Latest (overwriting)
-        latest_blob_path = f"{storage_prefix}/latest/{filename}"
-        blob = bucket.blob(latest_blob_path)
-        blob.upload_from_filename(str(local_file), content_type=content_type)
-        # Versioned snapshot
-        version_blob_path = f"{storage_prefix}/{version_folder}/{filename}"
-        version_blob = bucket.blob(version_blob_path)
-        version_blob.upload_from_filename(str(local_file), content_type=content_type)
+    with tempfile.TemporaryDirectory(prefix="mhra-upload-") as scratch:
+        uploads: List[Tuple[Path, str]] = []
+        for filename in filenames:
+            local_file = latest_path / filename
+            if not local_file.exists():
+                continue
+            # Compress once; the latest and versioned blobs share the same gzip payload.
+            compressed_file = Path(scratch) / f"{filename}.gz"
+            _gzip_file(local_file, compressed_file)
+            # Latest (overwriting)
+            uploads.append((compressed_file, f"{storage_prefix}/latest/{filename}"))
+            # Versioned snapshot
+            uploads.append((compressed_file, f"{storage_prefix}/{version_folder}/{filename}"))
+        if not uploads:
+            return
+
+        def upload(compressed_file: Path, blob_path: str) -> None:
+            blob = bucket.blob(blob_path)
+            blob.content_encoding = "gzip"
+            blob.upload_from_filename(str(compressed_file), content_type="application/json")
+
+        # The SDK is blocking, so overlap the round-trips on a small thread pool sharing one bucket.
+        with ThreadPoolExecutor(max_workers=min(config.FIREBASE_UPLOAD_WORKERS, len(uploads))) as executor:
+            futures = [executor.submit(upload, compressed_file, blob_path) for compressed_file, blob_path in uploads]
+            for future in as_completed(futures):
+                future.result()
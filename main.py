@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import os
 import shutil
+from contextlib import ExitStack, aclosing, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Dict, Iterator, Optional
 
 from rich.console import Console
 from rich.progress import (
@@ -18,9 +19,15 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available on Windows
+    uvloop = None
+
 import config
 from firebase_upload import upload_generated_files
 from scraper import MHRAExtractor, NavigationFailure
+from utils import dumps
 
 
 def ensure_directories() -> None:
@@ -29,28 +36,120 @@ def ensure_directories() -> None:
 
 def get_next_version_directory() -> Path:
     config.PUBLIC_PATH.mkdir(parents=True, exist_ok=True)
+    prefix = config.OUTPUT_VERSION_PREFIX
     existing_versions = []
-    for candidate in config.PUBLIC_PATH.iterdir():
-        if not candidate.is_dir():
-            continue
-        if not candidate.name.startswith(config.OUTPUT_VERSION_PREFIX):
-            continue
-        suffix = candidate.name.replace(config.OUTPUT_VERSION_PREFIX, "").strip()
-        if suffix.isdigit():
-            existing_versions.append(int(suffix))
+    with os.scandir(config.PUBLIC_PATH) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if not entry.name.startswith(prefix):
+                continue
+            suffix = entry.name[len(prefix):].strip()
+            if suffix.isdigit():
+                existing_versions.append(int(suffix))
     next_index = max(existing_versions, default=0) + 1
     version_dir = config.PUBLIC_PATH / f"{config.OUTPUT_VERSION_PREFIX}{next_index}"
     version_dir.mkdir(parents=True, exist_ok=True)
     return version_dir
 
 
-def write_json(target: Path, data: dict) -> None:
-    with target.open("w", encoding="utf-8") as stream:
-        json.dump(data, stream, ensure_ascii=False, indent=2)
-        stream.write("\n")
+# Streamed outputs are written in many small chunks; a large buffer turns them into few write() syscalls.
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+@contextmanager
+def open_for_replace(target: Path, buffering: int = -1) -> Iterator[BinaryIO]:
+    """
+    Write to a temporary sibling and swap it into place once complete.
+    The old inode is never truncated, so version snapshots hardlinked to it stay intact.
+    """
+    temporary = target.with_name(f"{target.name}.tmp")
+    try:
+        with temporary.open("wb", buffering=buffering) as stream:
+            yield stream
+        os.replace(temporary, target)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def write_json(target: Path, data: dict, *, pretty: bool = False) -> None:
+    # Machine-consumed outputs stay compact; pretty-print only files people read.
+    with open_for_replace(target) as stream:
+        stream.write(dumps(data, pretty=pretty, newline=True))
+
+
+class JsonStreamWriter:
+    """
+    Writes `{**header, key: [item, ...], **trailer}` to an open binary stream one item at a time.
+    With `as_object`, items are `(name, value)` pairs written as members of a `key` object instead.
+    """
 
+    def __init__(self, stream: BinaryIO, header: dict, key: str, *, as_object: bool = False) -> None:
+        self._stream = stream
+        self._as_object = as_object
+        self._separator = b""
+        opening = dumps(header)[:-1]
+        if header:
+            opening += b","
+        stream.write(opening + dumps(key) + b":" + (b"{" if as_object else b"["))
 
-def build_update_certificate(stats: dict, version_label: str, generated_at: str) -> dict:
+    def write(self, item: object) -> None:
+        if self._as_object:
+            name, value = item
+            self._stream.write(self._separator + dumps(name) + b":" + dumps(value))
+        else:
+            self._stream.write(self._separator + dumps(item))
+        self._separator = b","
+
+    def close(self, trailer: Optional[dict] = None) -> None:
+        closing = b"}" if self._as_object else b"]"
+        if trailer:
+            closing += b"," + dumps(trailer)[1:-1]
+        self._stream.write(closing + b"}\n")
+
+
+async def write_streamed_outputs(extractor: MHRAExtractor, targets: Dict[str, Path], base_path: str) -> None:
+    """
+    Write the three data files while the crawl runs, one finished letter at a time, so letters are dropped once
+    written instead of the whole crawl being held in memory.
+    Files only replace the previous run's output if the crawl completes.
+    """
+    results = extractor.results_header()
+    with ExitStack() as files:
+
+        def open_stream(name: str) -> BinaryIO:
+            return files.enter_context(open_for_replace(targets[name], buffering=STREAM_BUFFER_SIZE))
+
+        mhra_ultra = JsonStreamWriter(open_stream("mhra_ultra"), results.mhra_ultra_header(), "letters")
+        pdf_links = JsonStreamWriter(open_stream("pdf_links"), results.pdf_links_header(), "pdf_links")
+        structure = JsonStreamWriter(
+            open_stream("structure"),
+            results.structure_mapping_header(base_path),
+            "structure",
+            as_object=True,
+        )
+        async with aclosing(extractor.stream()) as letters:
+            async for letter in letters:
+                mhra_ultra.write(letter.to_ultra_entry())
+                for document in letter.iter_documents():
+                    pdf_links.write(document.to_pdf_link_entry())
+                structure.write((letter.letter, letter.to_structure_mapping()))
+        mhra_ultra.close()
+        # The count is only known once the crawl is done, so it follows the list.
+        pdf_links.close({"total_pdf_links": extractor.stats.total_documents})
+        structure.close()
+
+
+def publish_snapshot(source: Path, version_directory: Path) -> None:
+    # Files are replaced rather than rewritten in place, so a hardlink is a stable snapshot.
+    destination = version_directory / source.name
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def build_update_certificate(stats: dict, version_label: str, generated_at: datetime) -> dict:
     return {
         "update_version": version_label,
         "update_timestamp": generated_at,
@@ -84,9 +183,14 @@ async def execute_scrape(
     letters_override: Optional[list] = None,
     max_substances: Optional[int] = None,
     max_products: Optional[int] = None,
+    concurrency: int = config.MAX_CONCURRENCY,
+    force_refresh: bool = False,
 ) -> None:
     ensure_directories()
     version_directory = get_next_version_directory()
+    generated_files = config.GENERATED_FILES
+    latest_path = config.LATEST_OUTPUT_PATH
+    data_files = {name: latest_path / generated_files[name] for name in ("mhra_ultra", "pdf_links", "structure")}
 
     letters = letters_override if letters_override is not None else config.LETTERS
     console = Console()
@@ -116,15 +220,19 @@ async def execute_scrape(
             letters_override=letters_override,
             max_substances=max_substances,
             max_products=max_products,
+            concurrency=concurrency,
+            force_refresh=force_refresh,
         ) as extractor:
             try:
-                extraction_results, pdf_links, stats = await extractor.run()
+                await write_streamed_outputs(extractor, data_files, base_path)
             except NavigationFailure as error:
                 console.print(f"[red]Navigation failure:[/red] {error}")
                 raise SystemExit(1) from error
+            stats = extractor.stats
+            generated_at = extractor.generated_at
 
-    mhra_ultra_payload = extraction_results.to_mhra_ultra()
-    structure_mapping_payload = extraction_results.to_structure_mapping(base_path)
+    for data_file in data_files.values():
+        publish_snapshot(data_file, version_directory)
 
     stats_payload = {
         "total_letters": stats.total_letters,
@@ -133,27 +241,11 @@ async def execute_scrape(
         "total_documents": stats.total_documents,
     }
 
-    certificate_payload = build_update_certificate(stats_payload, version_label, extraction_results.generated_at_utc)
-
-    latest_targets = {
-        config.GENERATED_FILES["mhra_ultra"]: mhra_ultra_payload,
-        config.GENERATED_FILES["pdf_links"]: {
-            "generated_at_utc": extraction_results.generated_at_utc,
-            "source": config.BASE_URL,
-            "total_pdf_links": stats.total_documents,
-            "pdf_links": pdf_links,
-        },
-        config.GENERATED_FILES["structure"]: structure_mapping_payload,
-        config.GENERATED_FILES["certificate"]: certificate_payload,
-    }
+    certificate_payload = build_update_certificate(stats_payload, version_label, generated_at)
 
-    for filename, payload in latest_targets.items():
-        destination = config.LATEST_OUTPUT_PATH / filename
-        write_json(destination, payload)
-
-    for filename in latest_targets.keys():
-        source = config.LATEST_OUTPUT_PATH / filename
-        shutil.copy2(source, version_directory / filename)
+    certificate_file = latest_path / generated_files["certificate"]
+    write_json(certificate_file, certificate_payload, pretty=True)
+    publish_snapshot(certificate_file, version_directory)
 
     if upload_to_firebase:
         bucket = firebase_bucket or config.FIREBASE_STORAGE_BUCKET
@@ -162,7 +254,7 @@ async def execute_scrape(
         else:
             try:
                 upload_generated_files(
-                    latest_path=config.LATEST_OUTPUT_PATH,
+                    latest_path=latest_path,
                     version_label=version_label,
                     bucket_name=bucket,
                     storage_prefix=config.FIREBASE_STORAGE_PREFIX,
@@ -174,7 +266,7 @@ async def execute_scrape(
                 raise SystemExit(1) from e
 
     console.print("[green]Extraction complete.[/green]")
-    console.print(f"[cyan]Latest dataset updated at:[/cyan] {config.LATEST_OUTPUT_PATH}")
+    console.print(f"[cyan]Latest dataset updated at:[/cyan] {latest_path}")
     console.print(f"[cyan]Version snapshot stored at:[/cyan] {version_directory}")
 
 
@@ -185,7 +277,18 @@ def parse_arguments() -> argparse.Namespace:
         "--request-delay",
         type=float,
         default=config.REQUEST_DELAY_SECONDS,
-        help="Delay in seconds between page navigations to be polite to the server.",
+        help="Minimum delay in seconds between page navigations, shared by all parallel pages, to be polite to the server.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=config.MAX_CONCURRENCY,
+        help="Number of browser pages crawling in parallel.",
+    )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Ignore the on-disk page cache and fetch every listing page from the site.",
     )
     parser.add_argument(
         "--version-label",
@@ -239,7 +342,9 @@ def main() -> None:
         max_substances = 2
         max_products = 10
 
-    asyncio.run(
+    # uvloop's libuv event loop when installed, otherwise the default asyncio loop.
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(
         execute_scrape(
             headless=not args.no_headless,
             request_delay=args.request_delay,
@@ -251,6 +356,8 @@ def main() -> None:
             letters_override=letters_override,
             max_substances=max_substances,
             max_products=max_products,
+            concurrency=args.concurrency,
+            force_refresh=args.force_refresh,
         )
     )
 
@@ -2,14 +2,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 
-def utc_now_iso() -> str:
-    return datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
+def utc_now() -> datetime:
+    # Serialised by orjson with OPT_UTC_Z, so output timestamps keep the "...Z" form.
+    return datetime.now(tz=timezone.utc)
 
 
-@dataclass
+_DOC_ULTRA_KEYS = (
+    "doc_url",
+    "doc_type",
+    "title",
+    "subtitle",
+    "file_size_kb",
+    "active_substances",
+    "product_label",
+    "product_url",
+)
+_PRODUCT_ULTRA_KEYS = ("label", "product_url", "documents")
+_SUBSTANCE_ULTRA_KEYS = ("name", "substance_url", "sub_drugs")
+_LETTER_ULTRA_KEYS = ("letter", "substances")
+
+
+@dataclass(slots=True)
 class Document:
     doc_url: str
     doc_type: str
@@ -19,7 +35,7 @@ class Document:
     active_substances: List[str]
     product_label: str
     product_url: str
-    collected_at_utc: str = field(default_factory=utc_now_iso)
+    collected_at_utc: datetime
 
     def to_pdf_link_entry(self) -> Dict[str, object]:
         return {
@@ -31,35 +47,36 @@ class Document:
             "active_substances": self.active_substances,
             "product_label": self.product_label,
             "product_url": self.product_url,
-            "full_url": self.doc_url,
             "collected_at_utc": self.collected_at_utc,
         }
 
     def to_ultra_entry(self) -> Dict[str, object]:
-        return {
-            "doc_url": self.doc_url,
-            "doc_type": self.doc_type,
-            "title": self.title,
-            "subtitle": self.subtitle,
-            "file_size_kb": self.file_size_kb,
-            "active_substances": self.active_substances,
-            "product_label": self.product_label,
-            "product_url": self.product_url,
-        }
-
-
-@dataclass
+        return dict(
+            zip(
+                _DOC_ULTRA_KEYS,
+                (
+                    self.doc_url,
+                    self.doc_type,
+                    self.title,
+                    self.subtitle,
+                    self.file_size_kb,
+                    self.active_substances,
+                    self.product_label,
+                    self.product_url,
+                ),
+            )
+        )
+
+
+@dataclass(slots=True)
 class Product:
     label: str
     product_url: str
     documents: List[Document] = field(default_factory=list)
 
     def to_ultra_entry(self) -> Dict[str, object]:
-        return {
-            "label": self.label,
-            "product_url": self.product_url,
-            "documents": [doc.to_ultra_entry() for doc in self.documents],
-        }
+        documents = [*map(Document.to_ultra_entry, self.documents)]
+        return dict(zip(_PRODUCT_ULTRA_KEYS, (self.label, self.product_url, documents)))
 
     def to_structure_mapping(self) -> List[str]:
         results: List[str] = []
@@ -71,57 +88,56 @@ class Product:
         return results
 
 
-@dataclass
+@dataclass(slots=True)
 class Substance:
     name: str
     substance_url: str
     products: List[Product] = field(default_factory=list)
 
     def to_ultra_entry(self) -> Dict[str, object]:
-        return {
-            "name": self.name,
-            "substance_url": self.substance_url,
-            "sub_drugs": [product.to_ultra_entry() for product in self.products],
-        }
+        sub_drugs = [*map(Product.to_ultra_entry, self.products)]
+        return dict(zip(_SUBSTANCE_ULTRA_KEYS, (self.name, self.substance_url, sub_drugs)))
 
     def to_structure_mapping(self) -> Dict[str, List[str]]:
         return {product.label: product.to_structure_mapping() for product in self.products}
 
 
-@dataclass
+@dataclass(slots=True)
 class LetterBucket:
     letter: str
     substances: List[Substance] = field(default_factory=list)
 
     def to_ultra_entry(self) -> Dict[str, object]:
-        return {
-            "letter": self.letter,
-            "substances": [substance.to_ultra_entry() for substance in self.substances],
-        }
+        substances = [*map(Substance.to_ultra_entry, self.substances)]
+        return dict(zip(_LETTER_ULTRA_KEYS, (self.letter, substances)))
 
     def to_structure_mapping(self) -> Dict[str, Dict[str, List[str]]]:
         return {substance.name: substance.to_structure_mapping() for substance in self.substances}
 
+    def iter_documents(self) -> Iterator[Document]:
+        for substance in self.substances:
+            for product in substance.products:
+                yield from product.documents
+
 
-@dataclass
-class ExtractionResults:
-    letters: List[LetterBucket]
-    generated_at_utc: str
+@dataclass(slots=True)
+class ResultsHeader:
+    """Run-level fields shared by the output files; the letters themselves are written as they are crawled."""
+
+    generated_at_utc: datetime
     source: str
+    total_letters: int
+    concurrency: Dict[str, int]
 
-    def to_mhra_ultra(self) -> Dict[str, object]:
+    def mhra_ultra_header(self) -> Dict[str, object]:
+        """Every mhra_ultra member except `letters`, so the file can be written one letter at a time."""
         return {
             "generated_at_utc": self.generated_at_utc,
             "source": self.source,
             "crawler_info": {
                 "strategy": "Ultra 3.0 - Full Extraction with Structure",
-                "total_letters": len(self.letters),
-                "concurrency": {
-                    "letters": 1,
-                    "substances": 1,
-                    "products": 1,
-                    "documents": 1,
-                },
+                "total_letters": self.total_letters,
+                "concurrency": dict(self.concurrency),
                 "features": [
                     "PDF Link Collection",
                     "Hierarchical Structure",
@@ -129,17 +145,22 @@ class ExtractionResults:
                     "Version Tracking",
                 ],
             },
-            "letters": [letter.to_ultra_entry() for letter in self.letters],
         }
 
-    def to_structure_mapping(self, base_path: str) -> Dict[str, object]:
+    def pdf_links_header(self) -> Dict[str, object]:
+        """Leading all_pdf_links members; `pdf_links` and its `total_pdf_links` count follow once known."""
+        return {
+            "generated_at_utc": self.generated_at_utc,
+            "source": self.source,
+        }
+
+    def structure_mapping_header(self, base_path: str) -> Dict[str, object]:
+        """Every structure-mapping member except `structure`, so the file can be written one letter at a time."""
         return {
             "metadata": {
                 "created": self.generated_at_utc,
                 "basePath": base_path,
-                "totalTopLevelDirectories": len(self.letters),
+                "totalTopLevelDirectories": self.total_letters,
                 "structure": "Level 1: Letters/Numbers -> Level 2: Drug Names -> Level 3: Formulations -> Level 4: PDF Files",
             },
-            "structure": {letter.letter: letter.to_structure_mapping() for letter in self.letters},
         }
-
@@ -0,0 +1,70 @@
+"""
+On-disk cache of fetched listing pages, keyed by URL (SQLite).
+Fresh entries are served without touching the network; stale ones are revalidated with a conditional GET.
+"""
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(slots=True)
+class CachedPage:
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return time.time() - self.fetched_at < ttl_seconds
+
+    def revalidation_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        # WAL keeps the per-page commits cheap during a crawl.
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, html TEXT NOT NULL, etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL)"
+        )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        row = self._db.execute(
+            "SELECT html, etag, last_modified, fetched_at FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def put(self, url: str, html: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages (url, html, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, html, etag, last_modified, time.time()),
+            )
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as fresh again after the server answered 304 Not Modified."""
+        with self._db:
+            self._db.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def discard(self, url: str) -> None:
+        """Drop an entry whose page turned out to be unusable, e.g. a challenge page or an empty listing."""
+        with self._db:
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+
+    def close(self) -> None:
+        self._db.close()
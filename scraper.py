@@ -2,29 +2,78 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from typing import AsyncIterator, Awaitable, ClassVar, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar
 
-from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
-from tenacity import (RetryError, retry, retry_if_exception_type,
-                      stop_after_attempt, wait_exponential)
+import httpx
+from bs4 import BeautifulSoup
+from playwright.async_api import (Browser, BrowserContext, Error as PlaywrightError, Page, Playwright, Route,
+                                  TimeoutError as PlaywrightTimeoutError, async_playwright)
 
 import config
-from models import Document, ExtractionResults, LetterBucket, Product, Substance
+from models import Document, LetterBucket, Product, ResultsHeader, Substance, utc_now
+from page_cache import PageCache
 from utils import (collect_links, ensure_disclaimer_acknowledged,
-                   normalise_whitespace, parse_active_substances,
-                   parse_file_size, resolve_url)
+                   extract_links, normalise_whitespace, parse_metadata,
+                   resolve_url)
 
 logger = logging.getLogger("MHRAExtractor")
 logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s %(name)s: %(message)s")
 
 
+# Reads every search result of a product page in one round-trip instead of several locator calls per document.
+SEARCH_RESULTS_SCRIPT = """
+() => Array.from(document.querySelectorAll("section.column.results div.search-result"), (result) => {
+    const text = (selector) => {
+        const element = result.querySelector(selector);
+        return element ? element.innerText : null;
+    };
+    const anchor = result.querySelector("dd.right a");
+    return {
+        href: anchor ? anchor.getAttribute("href") : null,
+        doc_type: text("dt.left p.icon"),
+        title: text("dd.right a p.title"),
+        subtitle: text("dd.right a p.subtitle"),
+        metadata: Array.from(
+            result.querySelectorAll("dd.right p.metadata"),
+            (element) => element.innerText.replace(/\\s+/g, " ").trim(),
+        ),
+    };
+})
+"""
+
+
 class NavigationFailure(Exception):
     """Raised when the browser fails to navigate to a page after retries."""
 
 
-@dataclass
+# Seconds to wait before each retry: exponential from 1s, capped at 8s.
+_RETRY_BACKOFF_SECONDS = (1, 2, 4, 8, 8)
+
+
+def _retry_delay(attempt: int) -> int:
+    return _RETRY_BACKOFF_SECONDS[min(attempt, len(_RETRY_BACKOFF_SECONDS)) - 1]
+
+
+_T = TypeVar("_T")
+
+
+async def _gather_or_cancel(awaitables: Iterable[Awaitable[_T]]) -> List[_T]:
+    """Like `asyncio.gather`, but when one task fails the others are cancelled and awaited before re-raising."""
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@dataclass(slots=True)
 class ScrapeStatistics:
     total_letters: int = 0
     total_substances: int = 0
@@ -32,7 +81,59 @@ class ScrapeStatistics:
     total_documents: int = 0
 
 
+class RateLimiter:
+    """Token bucket of size one: spaces acquisitions from all workers at least `interval` seconds apart."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self.interval
+
+
+class PagePool:
+    """Fixed set of pages on one browser context, each leased to a single worker at a time."""
+
+    def __init__(self) -> None:
+        self._pages: List[Page] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    async def open(self, context: BrowserContext, size: int) -> None:
+        for _ in range(size):
+            page = await context.new_page()
+            page.set_default_timeout(config.NAVIGATION_TIMEOUT_MS)
+            self._pages.append(page)
+            self._idle.put_nowait(page)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Page]:
+        page = await self._idle.get()
+        try:
+            yield page
+        finally:
+            self._idle.put_nowait(page)
+
+    async def close(self) -> None:
+        for page in self._pages:
+            await page.close()
+        self._pages.clear()
+
+
 class MHRAExtractor:
+    # Playwright and Chromium are started once and shared by every open extractor, each on its own context;
+    # the last one to exit shuts them down.
+    _playwright: ClassVar[Optional[Playwright]] = None
+    _browser: ClassVar[Optional[Browser]] = None
+    _browser_users: ClassVar[int] = 0
+    _browser_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+
     def __init__(
         self,
         *,
@@ -44,16 +145,24 @@ class MHRAExtractor:
         letters_override: Optional[List[str]] = None,
         max_substances: Optional[int] = None,
         max_products: Optional[int] = None,
+        concurrency: int = config.MAX_CONCURRENCY,
+        force_refresh: bool = False,
     ) -> None:
         self.headless = headless
         self.request_delay = request_delay
-        self.generated_at = datetime.now(tz=timezone.utc).isoformat().replace("+00:00", "Z")
-        self.playwright = None
-        self.browser = None
-        self.context = None
-        self.page = None
-        self.letters: List[LetterBucket] = []
-        self.pdf_links: List[dict] = []
+        self.concurrency = max(1, concurrency)
+        self.force_refresh = force_refresh
+        # One timestamp per run, shared by the results header and every collected document.
+        self.generated_at = utc_now()
+        self.context: Optional[BrowserContext] = None
+        # The disclaimer is remembered by the browser context, so it only has to be accepted once per session.
+        self.disclaimer_acknowledged = False
+        # Status, headers and body of each script fetched through the context route, keyed by URL.
+        self._resource_cache: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+        self.http: Optional[httpx.AsyncClient] = None
+        self.page_cache: Optional[PageCache] = None
+        self.pages = PagePool()
+        self.rate_limiter = RateLimiter(request_delay)
         self._letters = letters_override if letters_override is not None else config.LETTERS
         self.max_substances = max_substances
         self.max_products = max_products
@@ -61,190 +170,387 @@ class MHRAExtractor:
         self.console = console
         self.progress = progress
         self.progress_tasks: Dict[str, int] = progress_tasks or {}
+        self._progress_totals: Dict[str, int] = {}
+        self._progress_pending: Dict[str, dict] = {}
+        self._progress_flusher: Optional[asyncio.Task] = None
 
     async def __aenter__(self) -> "MHRAExtractor":
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.context = await self.browser.new_context()
-        self.page = await self.context.new_page()
-        self.page.set_default_timeout(config.NAVIGATION_TIMEOUT_MS)
+        self.page_cache = PageCache(config.PAGE_CACHE_PATH)
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            # Queued requests wait on the shared rate limiter, so only the network phases time out.
+            timeout=httpx.Timeout(config.NAVIGATION_TIMEOUT_MS / 1000, pool=None),
+            follow_redirects=True,
+            headers={"User-Agent": config.HTTP_USER_AGENT},
+        )
+        try:
+            browser = await self._acquire_browser(self.headless)
+            try:
+                self.context = await browser.new_context(
+                    java_script_enabled=True,
+                    bypass_csp=True,
+                    # Nothing is screenshotted, so a small viewport keeps layout and paint work down.
+                    viewport=config.BROWSER_VIEWPORT,
+                )
+                await self.context.route("**/*", self._filter_resources)
+                await self.pages.open(self.context, self.concurrency)
+            except BaseException:
+                await self._leave_browser()
+                raise
+        except BaseException:
+            # `async with` skips __aexit__ when __aenter__ raises, so everything opened so far is closed here.
+            await self._close_clients()
+            raise
+        if self.progress:
+            self._progress_flusher = asyncio.create_task(self._flush_progress_periodically())
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        if self.page:
-            await self.page.close()
-        if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
-
-    async def run(self) -> Tuple[ExtractionResults, List[dict], ScrapeStatistics]:
-        for letter in self._letters:
-            logger.info("Processing letter %s", letter)
-            self._log(f"[bold cyan]Letter[/bold cyan]: {letter}")
-            self._progress_set_description("letters", f"Letter {letter}")
-            letter_bucket = await self._process_letter(letter)
-            self.letters.append(letter_bucket)
-            self._progress_advance("letters")
-        results = ExtractionResults(
-            letters=self.letters,
+        if self._progress_flusher:
+            self._progress_flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._progress_flusher
+            self._flush_progress()
+        try:
+            if self.context:
+                await self._leave_browser()
+        finally:
+            await self._close_clients()
+
+    async def _leave_browser(self) -> None:
+        """Close this extractor's pages and context, then release the shared browser even if closing failed."""
+        try:
+            try:
+                await self.pages.close()
+            finally:
+                if self.context:
+                    context, self.context = self.context, None
+                    await context.close()
+        finally:
+            await self._release_browser()
+
+    async def _close_clients(self) -> None:
+        http, self.http = self.http, None
+        page_cache, self.page_cache = self.page_cache, None
+        try:
+            if http:
+                await http.aclose()
+        finally:
+            if page_cache:
+                page_cache.close()
+
+    @classmethod
+    async def _acquire_browser(cls, headless: bool) -> Browser:
+        """The shared browser, launched on first use; later callers get it as launched, whatever their `headless`."""
+        async with cls._browser_lock:
+            if cls._browser is None:
+                cls._playwright = await async_playwright().start()
+                try:
+                    cls._browser = await cls._playwright.chromium.launch(headless=headless)
+                except BaseException:
+                    await cls._playwright.stop()
+                    cls._playwright = None
+                    raise
+            cls._browser_users += 1
+            return cls._browser
+
+    @classmethod
+    async def _release_browser(cls) -> None:
+        async with cls._browser_lock:
+            cls._browser_users -= 1
+            if cls._browser_users:
+                return
+            browser, playwright = cls._browser, cls._playwright
+            cls._browser = cls._playwright = None
+            try:
+                await browser.close()
+            finally:
+                await playwright.stop()
+
+    async def _filter_resources(self, route: Route) -> None:
+        # Only the DOM is scraped, so assets that just affect rendering are never fetched.
+        request = route.request
+        if request.resource_type in config.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+        if request.resource_type not in config.CACHED_RESOURCE_TYPES or request.method != "GET":
+            await route.continue_()
+            return
+        cached = self._resource_cache.get(request.url)
+        if cached is None:
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except PlaywrightError:
+                # Leave the request to the browser rather than stalling the page on it.
+                logger.debug("Fetching %s for the resource cache failed", request.url, exc_info=True)
+                await route.continue_()
+                return
+            # The body comes back decoded, so its original encoding and length no longer apply.
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-encoding", "content-length")
+            }
+            cached = (response.status, headers, body)
+            if response.ok:
+                self._resource_cache[request.url] = cached
+        status, headers, body = cached
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    def results_header(self) -> ResultsHeader:
+        """Run-level fields of the results; the letters themselves are delivered by `stream`."""
+        return ResultsHeader(
             generated_at_utc=self.generated_at,
             source=config.BASE_URL,
+            total_letters=len(self._letters),
+            concurrency={
+                "letters": self.concurrency,
+                "substances": self.concurrency,
+                "products": self.concurrency,
+                "documents": self.concurrency,
+            },
         )
-        return results, self.pdf_links, self.stats
-
-    @retry(
-        stop=stop_after_attempt(config.MAX_RETRIES),
-        wait=wait_exponential(multiplier=1, min=1, max=8),
-        retry=retry_if_exception_type(PlaywrightTimeoutError),
-        reraise=True,
-    )
-    async def _navigate(self, url: str) -> None:
-        logger.debug("Navigating to %s", url)
-        response = await self.page.goto(url, wait_until="domcontentloaded")
-        if response and response.status >= 400:
-            raise PlaywrightTimeoutError(f"HTTP {response.status} for {url}")
-        await self.page.wait_for_load_state("networkidle")
 
-    async def _process_letter(self, letter: str) -> LetterBucket:
-        bucket = LetterBucket(letter=letter)
-        url = resolve_url(config.BASE_URL, config.SUBSTANCE_INDEX_PATH.format(letter=letter))
+    async def stream(self) -> AsyncIterator[LetterBucket]:
+        """
+        Yield each letter's results, in index order, as soon as that letter is complete.
+        Letters, substances and products are all crawled concurrently; a page is leased from the pool only while
+        one listing or product page is read. At most `concurrency` letters are in flight, so only their results
+        are held in memory instead of the whole crawl.
+        """
+        letters = iter(self._letters)
+        pending: Deque[asyncio.Task] = deque(
+            asyncio.ensure_future(self._run_letter(letter)) for letter in islice(letters, self.concurrency)
+        )
         try:
-            await self._navigate(url)
-        except RetryError as retry_error:
-            raise NavigationFailure(f"Failed to load letter index {letter}") from retry_error
+            while pending:
+                letter_bucket = await pending.popleft()
+                for letter in islice(letters, 1):
+                    pending.append(asyncio.ensure_future(self._run_letter(letter)))
+                yield letter_bucket
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run_letter(self, letter: str) -> LetterBucket:
+        logger.info("Processing letter %s", letter)
+        self._log(f"[bold cyan]Letter[/bold cyan]: {letter}")
+        self._progress_set_description("letters", f"Letter {letter}")
+        letter_bucket = await self._process_letter(letter)
+        self._progress_advance("letters")
+        return letter_bucket
+
+    async def _run_substance(self, substance_entry: dict) -> Substance:
+        name = substance_entry["text"]
+        self._progress_set_description("substances", f"Substance: {name}")
+        self._log(f"  [cyan]Substance[/cyan]: {name}")
+        substance = await self._process_substance(name, substance_entry["href"])
+        self.stats.total_substances += 1
+        self._progress_advance("substances")
+        return substance
+
+    async def _run_product(self, product_entry: dict) -> Product:
+        label = product_entry["text"]
+        self._progress_set_description("products", f"Product: {label}")
+        self._log(f"    [green]Product[/green]: {label}")
+        product = await self._process_product(label, product_entry["href"])
+        self.stats.total_products += 1
+        self._progress_advance("products")
+        return product
 
+    async def _navigate(self, page: Page, url: str) -> None:
+        error: Optional[Exception] = None
+        for attempt in range(config.MAX_RETRIES):
+            if attempt:
+                await asyncio.sleep(_retry_delay(attempt))
+            await self.rate_limiter.wait()
+            logger.debug("Navigating to %s", url)
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded")
+                if response and response.status >= 400:
+                    raise PlaywrightTimeoutError(f"HTTP {response.status} for {url}")
+                return
+            except PlaywrightTimeoutError as exc:
+                error = exc
+        raise NavigationFailure(f"Failed to load {url} after {config.MAX_RETRIES} attempts: {error}") from error
+
+    async def _fetch_html(self, url: str) -> str:
+        cached = None if self.force_refresh else self.page_cache.get(url)
+        if cached and cached.is_fresh(config.PAGE_CACHE_TTL_SECONDS):
+            return cached.html
+        headers = cached.revalidation_headers() if cached else None
+        error: Optional[Exception] = None
+        for attempt in range(config.MAX_RETRIES):
+            if attempt:
+                await asyncio.sleep(_retry_delay(attempt))
+            await self.rate_limiter.wait()
+            logger.debug("Fetching %s", url)
+            try:
+                response = await self.http.get(url, headers=headers)
+            except httpx.TransportError as exc:
+                error = exc
+                continue
+            except httpx.HTTPError as exc:
+                raise NavigationFailure(f"Failed to fetch {url}: {exc}") from exc
+            if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+                self.page_cache.touch(url)
+                return cached.html
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                # A refused or missing page will not change on retry; the browser fallback takes over instead.
+                if not response.is_server_error:
+                    raise NavigationFailure(f"Failed to fetch {url}: {exc}") from exc
+                error = exc
+                continue
+            self.page_cache.put(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return response.text
+        raise NavigationFailure(f"Failed to fetch {url} after {config.MAX_RETRIES} attempts: {error}") from error
+
+    async def _collect_listing_links(self, url: str, item_class: str, href_prefix: str) -> Optional[List[dict]]:
+        """
+        Links of a letter or substance listing page, or None when the page lists nothing.
+        Listings are server-rendered, so they are fetched over plain HTTP; the browser is only
+        used when that fails or finds no links.
+        """
+        # The item class is preferred; any nav link with the right prefix is the fallback.
+        selectors = (f"nav ul li.{item_class} a", "nav ul li a")
         try:
-            await self.page.wait_for_selector("nav ul li a[href^='/substance/']", timeout=5000)
-        except PlaywrightTimeoutError:
+            html = await self._fetch_html(url)
+        except NavigationFailure as error:
+            logger.warning("HTTP fetch of %s failed (%s); using the browser", url, error)
+        else:
+            document = BeautifulSoup(html, "html.parser")
+            links = extract_links(document, selectors, href_prefix)
+            if links:
+                return links
+            # Whatever came back is no use, so it must not be served from the cache on later runs either.
+            self.page_cache.discard(url)
+
+        async with self.pages.lease() as page:
+            await self._navigate(page, url)
+            try:
+                await page.wait_for_selector(f"nav ul li a[href^='{href_prefix}']", timeout=5000)
+            except PlaywrightTimeoutError:
+                return None
+            return await collect_links(page, selectors, href_prefix)
+
+    async def _process_letter(self, letter: str) -> LetterBucket:
+        bucket = LetterBucket(letter=letter)
+        url = config.LETTER_INDEX_URLS.get(letter) or resolve_url(
+            config.BASE_URL, config.SUBSTANCE_INDEX_PATH.format(letter=letter)
+        )
+        try:
+            substances = await self._collect_listing_links(url, "substance-name", "/substance/")
+        except NavigationFailure as error:
+            raise NavigationFailure(f"Failed to load letter index {letter}") from error
+        if substances is None:
             logger.warning("No substances found for letter %s", letter)
             self._log(f"[yellow]No substances found for letter {letter}[/yellow]")
             return bucket
-
-        substances = await collect_links(self.page, "nav ul li.substance-name a", "/substance/")
-        if not substances:
-            substances = await collect_links(self.page, "nav ul li a", "/substance/")
         if self.max_substances is not None:
             substances = substances[: self.max_substances]
             self._log(f"[yellow]Test: limiting to {len(substances)} substance(s)[/yellow]")
 
-        self._progress_prepare(
+        self._progress_extend(
             "substances",
             len(substances),
             f"Substances for letter {letter} ({len(substances)} total)",
         )
         self._log(f"[cyan]Substances[/cyan]: {len(substances)} for letter {letter}")
 
-        for substance_entry in substances:
-            name = substance_entry["text"]
-            self._progress_set_description("substances", f"Substance: {name}")
-            self._log(f"  [cyan]Substance[/cyan]: {name}")
-            relative_url = substance_entry["href"]
-            bucket.substances.append(await self._process_substance(name, relative_url))
-            self.stats.total_substances += 1
-            self._progress_advance("substances")
-            await asyncio.sleep(self.request_delay)
+        bucket.substances = await _gather_or_cancel(self._run_substance(entry) for entry in substances)
         return bucket
 
     async def _process_substance(self, name: str, relative_url: str) -> Substance:
         substance = Substance(name=name, substance_url=relative_url)
         url = resolve_url(config.BASE_URL, relative_url)
         try:
-            await self._navigate(url)
-        except RetryError as retry_error:
+            products = await self._collect_listing_links(url, "product-name", "/product/")
+        except NavigationFailure:
             logger.error("Failed to load substance %s", name)
             return substance
-
-        try:
-            await self.page.wait_for_selector("nav ul li a[href^='/product/']", timeout=5000)
-        except PlaywrightTimeoutError:
+        if products is None:
             logger.warning("No products found for substance %s", name)
             self._log(f"[yellow]No products found for substance {name}[/yellow]")
             return substance
-
-        products = await collect_links(self.page, "nav ul li.product-name a", "/product/")
-        if not products:
-            products = await collect_links(self.page, "nav ul li a", "/product/")
         if self.max_products is not None:
             products = products[: self.max_products]
             self._log(f"[yellow]Test: limiting to {len(products)} product(s)[/yellow]")
 
-        self._progress_prepare(
+        self._progress_extend(
             "products",
             len(products),
             f"Products for {name} ({len(products)} total)",
         )
         self._log(f"[green]Products[/green]: {len(products)} for substance {name}")
 
-        for product_entry in products:
-            label = product_entry["text"]
-            self._progress_set_description("products", f"Product: {label}")
-            self._log(f"    [green]Product[/green]: {label}")
-            relative_product_url = product_entry["href"]
-            product = await self._process_product(label, relative_product_url)
-            substance.products.append(product)
-            self.stats.total_products += 1
-            self._progress_advance("products")
-            await asyncio.sleep(self.request_delay)
+        substance.products = await _gather_or_cancel(self._run_product(entry) for entry in products)
         return substance
 
     async def _process_product(self, label: str, relative_url: str) -> Product:
+        async with self.pages.lease() as page:
+            return await self._extract_product(page, label, relative_url)
+
+    async def _wait_for_results(self, page: Page) -> None:
+        """Wait for the search results, accepting the disclaimer if this session has not yet done so."""
+        if self.disclaimer_acknowledged:
+            try:
+                await page.wait_for_selector("section.column.results", timeout=5000)
+                return
+            except PlaywrightTimeoutError:
+                # The session may have lapsed and brought the disclaimer back.
+                if await page.locator("#agree-checkbox").count() == 0:
+                    raise
+        else:
+            # _navigate returns at DOMContentLoaded; wait until either the disclaimer or the results are in the DOM.
+            await page.wait_for_selector("section.column.results, #agree-checkbox", timeout=5000)
+        await ensure_disclaimer_acknowledged(page)
+        self.disclaimer_acknowledged = True
+        await page.wait_for_selector("section.column.results", timeout=5000)
+
+    async def _extract_product(self, page: Page, label: str, relative_url: str) -> Product:
         product = Product(label=label, product_url=relative_url)
         url = resolve_url(config.BASE_URL, relative_url)
         try:
-            await self._navigate(url)
-        except (RetryError, PlaywrightTimeoutError) as error:
+            await self._navigate(page, url)
+        except NavigationFailure as error:
             logger.error("Failed to load product %s", label)
             self._log(f"[red]Failed to load product {label}: {error}[/red]")
             return product
 
-        await ensure_disclaimer_acknowledged(self.page)
-
         try:
-            await self.page.wait_for_selector("section.column.results", timeout=5000)
+            await self._wait_for_results(page)
         except PlaywrightTimeoutError:
             logger.info("No documents displayed for product %s", label)
             return product
 
-        results_locator = self.page.locator("section.column.results div.search-result")
-        count = await results_locator.count()
+        search_results = await page.evaluate(SEARCH_RESULTS_SCRIPT)
+        count = len(search_results)
 
-        self._progress_prepare(
+        self._progress_extend(
             "documents",
             count,
             f"Documents for {label} ({count} total)",
         )
         self._log(f"[magenta]Documents[/magenta]: {count} for product {label}")
 
-        for index in range(count):
-            result = results_locator.nth(index)
-            doc_anchor = result.locator("dd.right a").first
-            doc_href = await doc_anchor.get_attribute("href")
+        stats = self.stats
+        documents = product.documents
+        for result in search_results:
+            doc_href = result["href"]
             if not doc_href:
                 continue
 
             doc_url = resolve_url(config.BASE_URL, doc_href)
+            doc_type = normalise_whitespace(result["doc_type"]) if result["doc_type"] is not None else ""
+            title = normalise_whitespace(result["title"]) if result["title"] is not None else label
+            subtitle = normalise_whitespace(result["subtitle"]) if result["subtitle"] is not None else None
 
-            doc_type_element = result.locator("dt.left p.icon")
-            doc_type = normalise_whitespace(await doc_type_element.first.inner_text()) if await doc_type_element.count() else ""
-
-            title_element = result.locator("dd.right a p.title")
-            title = normalise_whitespace(await title_element.first.inner_text()) if await title_element.count() else label
-
-            subtitle_element = result.locator("dd.right a p.subtitle")
-            subtitle = normalise_whitespace(await subtitle_element.first.inner_text()) if await subtitle_element.count() else None
-
-            metadata_entries = await result.locator("dd.right p.metadata").all_inner_texts()
-            file_size_kb = None
-            active_substances = []
-            for metadata in metadata_entries:
-                metadata_clean = normalise_whitespace(metadata)
-                if "file size" in metadata_clean.lower():
-                    file_size_kb = parse_file_size(metadata_clean)
-                if "active substances" in metadata_clean.lower():
-                    active_substances = parse_active_substances(metadata_clean)
+            # Entries arrive whitespace-normalised, so joining on newlines keeps each one on its own line.
+            file_size_kb, active_substances = parse_metadata("\n".join(result["metadata"]))
 
             document = Document(
                 doc_url=doc_url,
@@ -255,48 +561,54 @@ class MHRAExtractor:
                 active_substances=active_substances,
                 product_label=label,
                 product_url=relative_url,
+                collected_at_utc=self.generated_at,
             )
             self._progress_set_description("documents", f"Document: {subtitle or title}")
-            product.documents.append(document)
-            self.pdf_links.append(document.to_pdf_link_entry())
-            self.stats.total_documents += 1
+            documents.append(document)
+            stats.total_documents += 1
             self._progress_advance("documents")
             self._log(f"      [magenta]Document[/magenta]: {subtitle or title} ({doc_type})")
 
         return product
 
+    def _pending_progress(self, key: str) -> Optional[dict]:
+        """Changes queued for the `key` bar until the next flush, or None when there is no bar to update."""
+        if not self.progress or key not in self.progress_tasks:
+            return None
+        return self._progress_pending.setdefault(key, {})
+
     def _progress_set_description(self, key: str, description: str) -> None:
-        if not self.progress:
-            return
-        task_id = self.progress_tasks.get(key)
-        if task_id is None:
-            return
-        try:
-            self.progress.update(task_id, description=description)
-        except Exception:  # pragma: no cover - progress failures should not break extraction
-            logger.debug("Failed updating progress description for %s", key, exc_info=True)
+        pending = self._pending_progress(key)
+        if pending is not None:
+            pending["description"] = description
 
     def _progress_advance(self, key: str, amount: int = 1) -> None:
-        if not self.progress or amount == 0:
+        pending = self._pending_progress(key)
+        if pending is not None and amount:
+            pending["advance"] = pending.get("advance", 0) + amount
+
+    def _progress_extend(self, key: str, amount: int, description: str) -> None:
+        # Totals accumulate rather than reset, since several letters may be filling the same bar.
+        pending = self._pending_progress(key)
+        if pending is None:
             return
-        task_id = self.progress_tasks.get(key)
-        if task_id is None:
-            return
-        try:
-            self.progress.advance(task_id, amount)
-        except Exception:  # pragma: no cover
-            logger.debug("Failed advancing progress for %s", key, exc_info=True)
+        self._progress_totals[key] = self._progress_totals.get(key, 0) + amount
+        pending["total"] = self._progress_totals[key]
+        pending["description"] = description
 
-    def _progress_prepare(self, key: str, total: int, description: str) -> None:
-        if not self.progress:
-            return
-        task_id = self.progress_tasks.get(key)
-        if task_id is None:
-            return
-        try:
-            self.progress.update(task_id, total=total or 0, completed=0, description=description)
-        except Exception:  # pragma: no cover
-            logger.debug("Failed preparing progress for %s", key, exc_info=True)
+    def _flush_progress(self) -> None:
+        pending, self._progress_pending = self._progress_pending, {}
+        for key, changes in pending.items():
+            try:
+                self.progress.update(self.progress_tasks[key], **changes)
+            except Exception:  # pragma: no cover - progress failures should not break extraction
+                logger.debug("Failed updating progress for %s", key, exc_info=True)
+
+    async def _flush_progress_periodically(self) -> None:
+        # Rich re-renders on every update; batching keeps that off the per-document path.
+        while True:
+            await asyncio.sleep(config.PROGRESS_REFRESH_SECONDS)
+            self._flush_progress()
 
     def _log(self, message: str) -> None:
         if self.console:
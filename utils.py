@@ -1,22 +1,59 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
+import orjson
+from bs4 import Tag
 from playwright.async_api import Page
 
+import config
+
+# Timestamps are timezone-aware UTC datetimes, rendered as ISO 8601 with a "Z" suffix.
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+_WHITESPACE = re.compile(r"\s+")
+_SUBSTANCE_SEPARATOR = re.compile(r"[,;]")
+# Both metadata fields in one pattern; "." stops at newlines, so each line is matched on its own.
+_METADATA = re.compile(
+    r"file size\s*:\s*(?P<size>[0-9]+(?:\.[0-9]+)?)\s*(?P<unit>kb|mb)|active substances\s*:\s*(?P<substances>.+)",
+    re.IGNORECASE,
+)
+
+
+def dumps(value: object, *, pretty: bool = False, newline: bool = False) -> bytes:
+    """Serialise to UTF-8 JSON bytes with the options shared by every output file."""
+    option = JSON_OPTIONS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    if newline:
+        option |= orjson.OPT_APPEND_NEWLINE
+    return orjson.dumps(value, option=option)
+
 
 def normalise_whitespace(value: str) -> str:
-    return re.sub(r"\s+", " ", value).strip()
+    return _WHITESPACE.sub(" ", value).strip()
 
 
-def parse_file_size(metadata_text: str) -> Optional[int]:
-    match = re.search(r"file size\s*:\s*([0-9]+(?:\.[0-9]+)?)\s*(kb|mb)", metadata_text, re.IGNORECASE)
-    if not match:
-        return None
-    size_value = float(match.group(1))
-    unit = match.group(2).lower()
+def parse_metadata(metadata_text: str) -> Tuple[Optional[int], List[str]]:
+    """
+    File size (KB) and active substances from newline-separated metadata entries, in a single scan.
+    When a field appears in several entries, the later entry wins.
+    """
+    file_size_kb: Optional[int] = None
+    active_substances: List[str] = []
+    for match in _METADATA.finditer(metadata_text):
+        if match.group("substances") is not None:
+            active_substances = _split_substances(match.group("substances"))
+        else:
+            file_size_kb = _size_in_kb(match.group("size"), match.group("unit"))
+    return file_size_kb, active_substances
+
+
+def _size_in_kb(value: str, unit: str) -> Optional[int]:
+    size_value = float(value)
+    unit = unit.lower()
     if unit == "kb":
         return int(round(size_value))
     if unit == "mb":
@@ -24,16 +61,23 @@ def parse_file_size(metadata_text: str) -> Optional[int]:
     return None
 
 
-def parse_active_substances(metadata_text: str) -> List[str]:
-    match = re.search(r"active substances\s*:\s*(.+)", metadata_text, re.IGNORECASE)
-    if not match:
-        return []
-    payload = match.group(1)
-    parts = re.split(r",|;", payload)
-    return [normalise_whitespace(part) for part in parts if normalise_whitespace(part)]
+def _split_substances(payload: str) -> List[str]:
+    parts = (normalise_whitespace(part) for part in _SUBSTANCE_SEPARATOR.split(payload))
+    return [part for part in parts if part]
+
+
+_BASE_URL_PREFIX = config.BASE_URL + "/"
 
 
 def resolve_url(base_url: str, relative_url: str) -> str:
+    # Site links are root-relative paths, so against the bare origin urljoin reduces to concatenation, and
+    # absolute links on the origin come back unchanged (dot segments and protocol-relative links still go
+    # through urljoin).
+    if base_url == config.BASE_URL and "/." not in relative_url:
+        if relative_url.startswith("/") and not relative_url.startswith("//"):
+            return base_url + relative_url
+        if relative_url.startswith(_BASE_URL_PREFIX):
+            return relative_url
     return urljoin(base_url, relative_url)
 
 
@@ -49,20 +93,45 @@ async def ensure_disclaimer_acknowledged(page: Page) -> None:
     await page.wait_for_load_state("networkidle")
 
 
-async def collect_links(page: Page, selector: str, href_prefix: Optional[str] = None) -> List[dict]:
-    elements = page.locator(selector)
-    count = await elements.count()
-    results: List[dict] = []
-    for index in range(count):
-        element = elements.nth(index)
-        href = await element.get_attribute("href")
+# Pairs every matched element with the index of the first selector it satisfies, its href and its
+# whitespace-normalised text, so the whole listing comes back in one round-trip.
+_LINK_RANKS_SCRIPT = """
+(elements, selectors) => elements.map((element) => [
+    selectors.findIndex((selector) => element.matches(selector)),
+    element.getAttribute("href"),
+    element.innerText.replace(/\\s+/g, " ").trim(),
+])
+"""
+
+
+async def collect_links(page: Page, selectors: Sequence[str], href_prefix: Optional[str] = None) -> List[dict]:
+    """
+    Links matched by the first of `selectors` (in priority order) that yields any, from a single DOM query.
+    Repeated hrefs keep their first occurrence.
+    """
+    elements = page.locator(", ".join(selectors))
+    candidates: Dict[int, Dict[str, dict]] = {}
+    for rank, href, text in await elements.evaluate_all(_LINK_RANKS_SCRIPT, list(selectors)):
+        if not href or not text:
+            continue
+        if href_prefix and not href.startswith(href_prefix):
+            continue
+        candidates.setdefault(rank, {}).setdefault(href, {"text": text, "href": href})
+    return list(candidates[min(candidates)].values()) if candidates else []
+
+
+def extract_links(document: Tag, selectors: Sequence[str], href_prefix: Optional[str] = None) -> List[dict]:
+    """Same result as `collect_links`, read from parsed HTML instead of a live page."""
+    candidates: Dict[int, Dict[str, dict]] = {}
+    for element in document.select(", ".join(selectors)):
+        href = element.get("href")
         if not href:
             continue
         if href_prefix and not href.startswith(href_prefix):
             continue
-        text = normalise_whitespace(await element.inner_text())
+        text = normalise_whitespace(element.get_text())
         if not text:
             continue
-        results.append({"text": text, "href": href})
-    return results
-
+        rank = next(index for index, selector in enumerate(selectors) if element.css.match(selector))
+        candidates.setdefault(rank, {}).setdefault(href, {"text": text, "href": href})
+    return list(candidates[min(candidates)].values()) if candidates else []